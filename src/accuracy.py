@@ -0,0 +1,240 @@
+import math
+import time
+from typing import Callable, Dict, List, Optional, Tuple, get_args
+
+import numpy as np
+import pandas as pd
+
+from .chromatic_adaptation import illuminant_chromatic_adaptation_matrix
+from .contrast import weber_fechner_contrast
+from .spaces.hsl import HSL, HSLstd
+from .spaces.hsv import HSV, HSVstd
+from .spaces.oklab import OKLAB, Oklab_LMS_matrix, Oklab_matrix
+from .spaces.rgb import RGB, rgb_colorimetry, rgb_colorimetry_space_names
+from .spaces.xyz import XYZ, rgb_to_xyz_matrix
+from .transfer import decode_integer
+
+# Spaces of data/rgb.csv with primaries ("Lab Gamut" has none).
+rgb_space_names = [name for name in get_args(rgb_colorimetry_space_names) if name != "Lab Gamut"]
+
+# A case is (reference applied to one (3,) color at a time, fast path applied to the whole (N, 3) batch, color set).
+Case = Tuple[Callable[[np.ndarray], np.ndarray], Callable[[np.ndarray], np.ndarray], str]
+
+
+# Frozen scalar references: per color, Python float per channel implementations of the conversions as they were
+# before the vectorized fast paths, kept apart from them so the harness never compares a fast path against itself.
+def _reference_decode(rgb_space_name: str) -> Callable[[float], float]:
+    gamma = rgb_colorimetry[rgb_colorimetry["Name"] == rgb_space_name]["Gamma"].item()
+
+    def decode_channel(C: float) -> float:
+        A = abs(C)
+        if rgb_space_name == "sRGB":
+            A = A / 12.92 if A <= 0.04045 else ((A + 0.055) / 1.055) ** 2.4
+        elif gamma == "L*":
+            A = ((A + 0.16) / 1.16) ** 3 if A > 0.08 else A * 100 / (24389 / 27)
+        else:
+            A = A ** float(gamma)
+        return math.copysign(A, C)
+
+    return decode_channel
+
+
+def _reference_srgb_encode(C: float) -> float:
+    A = abs(C)
+    A = A * 12.92 if A <= 0.0031308 else 1.055 * A ** (1 / 2.4) - 0.055
+    return math.copysign(A, C)
+
+
+def _reference_matrix(rgb_space_name: str, bradford_adapted_d50: bool = True) -> np.ndarray[float]:
+    # Built from the dataframes on every call, as XYZ.from_rgb did before the adapted matrices were cached.
+    M = rgb_to_xyz_matrix(rgb_space_name)
+    if bradford_adapted_d50:
+        w_ref = rgb_colorimetry[rgb_colorimetry["Name"] == rgb_space_name]["Reference White"].item()
+        if w_ref != "D50":
+            BFM = illuminant_chromatic_adaptation_matrix(w_ref, "D50", "Bradford")
+            M = BFM @ M
+    return M
+
+
+def _reference_rgb_to_xyz(
+    color: np.ndarray[float], decode_channel: Callable[[float], float], M: np.ndarray[float]
+) -> np.ndarray[float]:
+    return M @ np.array([decode_channel(float(C)) for C in color])
+
+
+def _reference_xyz_to_oklab(xyz: np.ndarray[float]) -> np.ndarray[float]:
+    lms = np.array(Oklab_LMS_matrix) @ xyz
+    return np.array(Oklab_matrix) @ lms ** (1 / 3)
+
+
+def _reference_oklab_to_srgb(lab: np.ndarray[float], M: np.ndarray[float]) -> np.ndarray[float]:
+    lms = (np.linalg.inv(Oklab_matrix) @ lab) ** 3
+    rgb = np.linalg.inv(M) @ (np.linalg.inv(Oklab_LMS_matrix) @ lms)
+    return np.array([_reference_srgb_encode(float(C)) for C in rgb])
+
+
+def _reference_contrast(color: np.ndarray[float], bg: np.ndarray[float]) -> float:
+    # The original if-based Clin, with the sRGB branches the right way round.
+    def luminance(rgb: np.ndarray[float]) -> float:
+        def Clin(C: float) -> float:
+            return C / 12.92 if C <= 0.04045 else ((C + 0.055) / (1 + 0.055)) ** 2.4
+
+        R, G, B = (float(C) for C in rgb)
+        return 0.2126 * Clin(R) + 0.7152 * Clin(G) + 0.0722 * Clin(B)
+
+    return (luminance(color) - luminance(bg)) / luminance(bg)
+
+
+def color_sets(nb_colors: int = 2000, seed: int = 0) -> Dict[str, np.ndarray[float]]:
+    # Randomized colors plus the edge cases the fast paths are the most likely to get wrong.
+    rng = np.random.default_rng(seed)
+    grays = np.repeat(np.concatenate([[0.0, 1.0, 0.5, 0.04045, 0.0031308], rng.random(nb_colors)])[:, None], 3, 1)
+    hue_wrap = HSLstd(
+        np.stack(
+            [
+                np.concatenate([rng.uniform(0.98, 1.0, nb_colors // 2), rng.uniform(0.0, 0.02, nb_colors // 2)]),
+                rng.random(nb_colors // 2 * 2),
+                rng.uniform(0.05, 0.95, nb_colors // 2 * 2),
+            ],
+            axis=-1,
+        )
+    ).to_rgb()
+    edges = rng.choice([0.0, 1e-9, 0.5, 1 - 1e-9, 1.0], (nb_colors, 3))
+    code_values = rng.integers(0, 256, (nb_colors, 3))
+    return {
+        "random": rng.random((nb_colors, 3)),
+        "achromatic": grays,
+        "hue wrap-around": np.clip(hue_wrap.values, 0, 1),
+        "gamut edges": edges,
+        "8 bits": code_values / 255,
+        "hsl": rng.random((nb_colors, 3)),
+        "oklab": RGB(rng.random((nb_colors, 3))).to_oklab().values,
+    }
+
+
+def cases() -> Dict[str, Case]:
+    rgb_sets = ["random", "achromatic", "hue wrap-around", "gamut edges", "8 bits"]
+    white = np.ones(3)
+    srgb_decode, srgb_M = _reference_decode("sRGB"), _reference_matrix("sRGB")
+    result: Dict[str, Case] = {}
+    for colors in rgb_sets:
+        result[f"RGB.to_oklab [{colors}]"] = (
+            lambda c: _reference_xyz_to_oklab(_reference_rgb_to_xyz(c, srgb_decode, srgb_M)),
+            lambda v: RGB(v).to_oklab().values,
+            colors,
+        )
+        for space in (HSL, HSLstd, HSV, HSVstd):
+            result[f"{space.__name__}.from_rgb [{colors}]"] = (
+                lambda c, space=space: space.from_rgb(RGB(c)).values,
+                lambda v, space=space: space.from_rgb(RGB(v)).values,
+                colors,
+            )
+        result[f"weber_fechner_contrast [{colors}]"] = (
+            lambda c: np.array([_reference_contrast(c, white)]),
+            lambda v: weber_fechner_contrast(RGB(v), RGB(white))[:, None],
+            colors,
+        )
+    for space in (HSL, HSLstd, HSV, HSVstd):
+        result[f"{space.__name__}.to_rgb [hsl]"] = (
+            lambda c, space=space: space(c).to_rgb().values,
+            lambda v, space=space: space(v).to_rgb().values,
+            "hsl",
+        )
+    result["OKLAB.to_rgb [oklab]"] = (
+        lambda c: _reference_oklab_to_srgb(c, srgb_M),
+        lambda v: OKLAB(v).to_rgb().values,
+        "oklab",
+    )
+    for name in rgb_space_names:
+        decode_channel = _reference_decode(name)
+        M, M_unadapted = _reference_matrix(name), _reference_matrix(name, False)
+        w_ref = rgb_colorimetry[rgb_colorimetry["Name"] == name]["Reference White"].item()
+        # Every reference white of data/rgb.csv (D50, D65, C and E) is adapted through the spaces using it.
+        result[f"XYZ.from_rgb Bradford {w_ref} -> D50 {name} [random]"] = (
+            lambda c, decode_channel=decode_channel, M=M: _reference_rgb_to_xyz(c, decode_channel, M),
+            lambda v, name=name: XYZ.from_rgb(RGB(v), name, bradford_adapted_d50=True).values,
+            "random",
+        )
+        result[f"XYZ.from_rgb unadapted {name} [random]"] = (
+            lambda c, decode_channel=decode_channel, M=M_unadapted: _reference_rgb_to_xyz(c, decode_channel, M),
+            lambda v, name=name: XYZ.from_rgb(RGB(v), name, bradford_adapted_d50=False).values,
+            "random",
+        )
+        result[f"XYZ.from_rgb_integer LUT {name} [8 bits]"] = (
+            lambda c, decode_channel=decode_channel, M=M: _reference_rgb_to_xyz(c, decode_channel, M),
+            lambda v, name=name: XYZ.from_rgb_integer(np.rint(v * 255).astype(int), 8, name).values,
+            "8 bits",
+        )
+        result[f"decode_integer 16 bits {name} [random]"] = (
+            lambda c, decode_channel=decode_channel: np.array([decode_channel(round(C * 65535) / 65535) for C in c]),
+            lambda v, name=name: decode_integer(np.rint(v * 65535).astype(int), name, 16),
+            "random",
+        )
+    return result
+
+
+def _timed(function: Callable[[], np.ndarray], repeats: int = 1) -> Tuple[np.ndarray, float]:
+    # A first untimed call fills the caches (matrices, decode tables, ...), then the best of the timed repeats is kept.
+    result = function()
+    elapsed = np.inf
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = function()
+        elapsed = min(elapsed, time.perf_counter() - start)
+    return result, elapsed
+
+
+def run(
+    nb_colors: int = 2000,
+    seed: int = 0,
+    dtype: Optional[type] = None,
+    names: Optional[List[str]] = None,
+    repeats: int = 5,
+) -> pd.DataFrame:
+    # Runs every case (or the ones whose name contains one of `names`) on both paths and reports the max/mean absolute
+    # error of the fast path against the reference, the NaN mismatches and the throughput of each path in colors/s.
+    # With a dtype (e.g. np.float32), the fast path inputs are cast to it to measure the error of a reduced precision.
+    # Both paths are timed after a warm-up call, the fast one on the best of `repeats` runs.
+    sets = color_sets(nb_colors, seed)
+    rows = []
+    for name, (reference, fast, colors) in cases().items():
+        if names is not None and not any(pattern in name for pattern in names):
+            continue
+        values = sets[colors]
+        fast_values = values if dtype is None else values.astype(dtype)
+        with np.errstate(all="ignore"):
+            expected, reference_time = _timed(lambda: np.array([reference(color) for color in values], dtype=float))
+            actual, fast_time = _timed(
+                lambda: np.asarray(fast(fast_values), dtype=float).reshape(expected.shape), repeats
+            )
+            error = np.abs(actual - expected)
+        nan_mismatch = np.isnan(actual) != np.isnan(expected)
+        rows.append(
+            {
+                "case": name,
+                "colors": len(values),
+                "max error": np.nanmax(error) if np.any(~np.isnan(error)) else np.nan,
+                "mean error": np.nanmean(error) if np.any(~np.isnan(error)) else np.nan,
+                "nan mismatch": int(nan_mismatch.any(axis=-1).sum()),
+                "reference colors/s": len(values) / reference_time,
+                "fast colors/s": len(values) / fast_time,
+                "speed-up": reference_time / fast_time,
+            }
+        )
+    return pd.DataFrame(rows)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Compare every fast path against its scalar reference.")
+    parser.add_argument("--nb-colors", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--dtype", choices=["float64", "float32"], default=None)
+    parser.add_argument("--case", action="append", default=None, help="Only run cases containing this string.")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+    dtype = None if args.dtype is None else np.dtype(args.dtype).type
+    report = run(args.nb_colors, args.seed, dtype, args.case, args.repeats)
+    with pd.option_context("display.max_rows", None, "display.width", 200, "display.float_format", "{:.3g}".format):
+        print(report.to_string(index=False))
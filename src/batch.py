@@ -0,0 +1,144 @@
+from pathlib import Path
+from typing import Iterator, Optional, Tuple
+
+import pandas as pd
+
+from .contrast import weber_fechner_contrast
+from .search import weber_fechner_match
+from .spaces.oklab import OKLAB
+from .spaces.rgb import HEX, RGB, RGB255
+from .spaces.xyz import XYZ
+
+DEFAULT_CHUNKSIZE: int = 100_000
+
+
+def read_chunks(
+    path: str | Path, chunksize: int = DEFAULT_CHUNKSIZE, text_columns: Tuple[str, ...] = ()
+) -> Iterator[pd.DataFrame]:
+    # Only one chunk of the table is held in memory at a time, whatever the size of the file. CSV text_columns (e.g.
+    # hex colors) are read as strings, so that "112233" is not inferred as an integer nor "001122" loses its zeros.
+    path = Path(path)
+    if path.suffix == ".parquet":
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Reading parquet files requires pyarrow (pip install pyarrow).") from e
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, chunksize=chunksize, dtype={column: str for column in text_columns})
+
+
+def parse_colors(chunk: pd.DataFrame, column: str) -> RGB:
+    # A color is either a single "#RRGGBB" column or three <column>_r, <column>_g, <column>_b columns in [0; 255].
+    if column in chunk.columns:
+        rgb255 = HEX.strings_to_rgb255(chunk[column])
+    else:
+        values = chunk[[f"{column}_r", f"{column}_g", f"{column}_b"]].apply(pd.to_numeric, errors="coerce")
+        valid = (values.notna() & (values % 1 == 0) & (values >= 0) & (values <= 255)).all(axis=1)
+        if not valid.all():
+            invalid = values[~valid]
+            raise ValueError(
+                f"{len(invalid)} invalid {column} RGB255 color(s), expected integers in [0; 255]: "
+                + ", ".join(f"{index}: {tuple(row)}" for index, row in zip(invalid.index, invalid.values[:10].tolist()))
+                + (", ..." if len(invalid) > 10 else "")
+            )
+        rgb255 = RGB255(values.to_numpy(dtype=int))
+    return rgb255.to_rgb()
+
+
+def parse_chunks(
+    chunks: Iterator[pd.DataFrame], fg_column: str = "fg", bg_column: str = "bg"
+) -> Iterator[Tuple[pd.DataFrame, RGB, RGB]]:
+    for chunk in chunks:
+        yield chunk, parse_colors(chunk, fg_column), parse_colors(chunk, bg_column)
+
+
+def convert_chunks(stream: Iterator[Tuple[pd.DataFrame, RGB, RGB]]) -> Iterator[Tuple[pd.DataFrame, RGB, RGB, OKLAB]]:
+    for chunk, rgb_fg, rgb_bg in stream:
+        # Parsed colors are 8 bits code values, linearized through the decode LUT rather than a pow per channel. The
+        # OkLab of fg is passed down the stream so that the match stage does not convert it again.
+        oklab_fg = XYZ.from_rgb255(rgb_fg.to_rgb255(), bradford_adapted_d50=False).to_oklab()
+        lab = oklab_fg.values
+        chunk = chunk.assign(fg_oklab_l=lab[:, 0], fg_oklab_a=lab[:, 1], fg_oklab_b=lab[:, 2])
+        yield chunk, rgb_fg, rgb_bg, oklab_fg
+
+
+def match_chunks(
+    stream: Iterator[Tuple[pd.DataFrame, RGB, RGB, OKLAB]], wfc_target: Optional[float] = None
+) -> Iterator[Tuple[pd.DataFrame, RGB, RGB, OKLAB]]:
+    for chunk, rgb_fg, rgb_bg, oklab_fg in stream:
+        if wfc_target is not None:
+            rgb_match = weber_fechner_match(rgb_fg, rgb_bg, wfc_target, oklab_fg=oklab_fg)
+            chunk = chunk.assign(
+                match=HEX.strings_from_rgb255(rgb_match.to_rgb255()),
+                match_wfc=weber_fechner_contrast(rgb_match, rgb_bg),
+            )
+        yield chunk, rgb_fg, rgb_bg, oklab_fg
+
+
+def score_chunks(stream: Iterator[Tuple[pd.DataFrame, RGB, RGB, OKLAB]]) -> Iterator[pd.DataFrame]:
+    for chunk, rgb_fg, rgb_bg, _ in stream:
+        yield chunk.assign(wfc=weber_fechner_contrast(rgb_fg, rgb_bg))
+
+
+def write_chunks(chunks: Iterator[pd.DataFrame], path: str | Path) -> int:
+    # Writing every chunk as soon as it is produced, returns the number of written rows.
+    path = Path(path)
+    rows = 0
+    if path.suffix == ".parquet":
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Writing parquet files requires pyarrow (pip install pyarrow).") from e
+        writer = None
+        try:
+            for chunk in chunks:
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(path, table.schema)
+                writer.write_table(table)
+                rows += len(chunk)
+        finally:
+            if writer is not None:
+                writer.close()
+    else:
+        for chunk in chunks:
+            chunk.to_csv(path, mode="a" if rows else "w", header=not rows, index=False)
+            rows += len(chunk)
+    return rows
+
+
+def weber_fechner_batch(
+    input_path: str | Path,
+    output_path: str | Path,
+    wfc_target: Optional[float] = None,
+    fg_column: str = "fg",
+    bg_column: str = "bg",
+    chunksize: int = DEFAULT_CHUNKSIZE,
+) -> int:
+    # Streaming a CSV/Parquet table of color pairs through parsing, conversion, matching (when a target contrast is
+    # given) and scoring, with memory bounded by the chunk size.
+    chunks = read_chunks(input_path, chunksize, (fg_column, bg_column))
+    stream = parse_chunks(chunks, fg_column, bg_column)
+    stream = convert_chunks(stream)
+    stream = match_chunks(stream, wfc_target)
+    return write_chunks(score_chunks(stream), output_path)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Score (and match) a CSV/Parquet table of color pairs.")
+    parser.add_argument("input_path")
+    parser.add_argument("output_path")
+    parser.add_argument("--wfc-target", type=float, default=None)
+    parser.add_argument("--fg-column", default="fg")
+    parser.add_argument("--bg-column", default="bg")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE)
+    args = parser.parse_args()
+    rows = weber_fechner_batch(
+        args.input_path, args.output_path, args.wfc_target, args.fg_column, args.bg_column, args.chunksize
+    )
+    print(f"{rows} rows written to {args.output_path}")
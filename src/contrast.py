@@ -1,22 +1,22 @@
-from typing import Callable, Tuple
+from typing import Callable, Optional, Tuple
 
 import numpy as np
 
 from src.spaces.abstract import ColorSpace
 from src.spaces.hsl import HSL
 from src.spaces.rgb import RGB
+from src.transfer import srgb_decode
 
-GAMMA_CORRECTION: float = 2.4
+LUMINANCE_WEIGHTS: np.ndarray[float] = np.array([0.2126, 0.7152, 0.0722])
 
 
-def weber_fechner_contrast(rgb_fg: RGB, rgb_bg: RGB) -> float:
-    def luminance(rgb: RGB) -> float:
-        def Clin(C: float) -> float:
-            return C / 12.92 if C >= 0.04045 else ((C + 0.055) / (1 + 0.055)) ** GAMMA_CORRECTION
+def luminance(rgb: RGB) -> float | np.ndarray[float]:
+    # Relative luminance of sRGB colors, channels being linearized by the same curve as XYZ.from_rgb.
+    return srgb_decode(np.asarray(rgb.values, dtype=np.float64)) @ LUMINANCE_WEIGHTS
 
-        R, G, B = rgb.values
-        return 0.2126 * Clin(R) + 0.7152 * Clin(G) + 0.0722 * Clin(B)
 
+def weber_fechner_contrast(rgb_fg: RGB, rgb_bg: RGB) -> float | np.ndarray[float]:
+    # Works on a single (3,) color as well as on (..., 3) batches, broadcasting foregrounds against backgrounds.
     Lzone = luminance(rgb_fg)
     Lfond = luminance(rgb_bg)
     return (Lzone - Lfond) / Lfond
@@ -43,22 +43,159 @@ def weber_fechner_samples(
     return x, y
 
 
-def weber_fechner_fit(
+def _evaluate(
     rgb_base: RGB,
     rgb_ref: RGB,
-    nb_samples: int = 32,
+    value: float,
+    color_space_conv: Callable[[RGB], ColorSpace],
+    color_space_conv_inv: Callable[[ColorSpace], RGB],
+    color_space_dim: int,
+) -> float:
+    target = color_space_conv(rgb_base)
+    target[color_space_dim] = value
+    return weber_fechner_contrast(color_space_conv_inv(target), rgb_ref)
+
+
+def weber_fechner_adaptive_samples(
+    rgb_base: RGB,
+    rgb_ref: RGB,
+    wfc_target: float,
+    max_evaluations: int = 32,
+    initial_samples: int = 5,
+    tolerance: float = 1e-3,
     color_space_conv: Callable[[RGB], ColorSpace] = lambda rgb: RGB.to_hsl(rgb),
     color_space_conv_inv: Callable[[ColorSpace], RGB] = lambda hsl: HSL.to_rgb(hsl),
     color_space_dim: int = 2,
-) -> Tuple[float, float, float]:
-    x, y = weber_fechner_samples(rgb_base, rgb_ref, nb_samples, color_space_conv, color_space_conv_inv, color_space_dim)
+) -> Tuple[np.ndarray[float], np.ndarray[float]]:
+    # Starting from a coarse uniform grid, then bisecting the interval with the largest estimated error until every
+    # interval is under tolerance or the evaluation budget is spent. Intervals where the curve crosses the target
+    # contrast are scored on their contrast span, the others on their local curvature (linear interpolation error).
+    # Intervals next to a non-finite sample (e.g. a NaN contrast out of gamut) are never refined.
+    def evaluate(value: float) -> float:
+        return _evaluate(rgb_base, rgb_ref, value, color_space_conv, color_space_conv_inv, color_space_dim)
+
+    initial_samples = max(3, min(initial_samples, max_evaluations))
+    x = np.linspace(0.0, 1.0, initial_samples)
+    y = np.array([evaluate(value) for value in x])
+
+    while len(x) < max_evaluations:
+        dx = np.diff(x)
+        dy = np.diff(y)
+        slopes = dy / dx
+        curvature = np.abs(np.diff(slopes))
+        curvature = np.maximum(np.concatenate(([0.0], curvature)), np.concatenate((curvature, [0.0])))
+        error = curvature * dx / 4
+
+        crossing = (y[:-1] - wfc_target) * (y[1:] - wfc_target) <= 0
+        error[crossing] = np.maximum(error[crossing], np.abs(dy[crossing]))
+        error = np.nan_to_num(error, nan=-np.inf)
+
+        index = np.argmax(error)
+        if error[index] < tolerance:
+            break
+        value = (x[index] + x[index + 1]) / 2
+        x = np.insert(x, index + 1, value)
+        y = np.insert(y, index + 1, evaluate(value))
+
+    return x, y
+
+
+def weber_fechner_operating_error(
+    rgb_base: RGB,
+    rgb_ref: RGB,
+    wfc_target: float,
+    model: Callable[[np.ndarray[float]], np.ndarray[float]],
+    color_space_conv: Callable[[RGB], ColorSpace] = lambda rgb: RGB.to_hsl(rgb),
+    color_space_conv_inv: Callable[[ColorSpace], RGB] = lambda hsl: HSL.to_rgb(hsl),
+    color_space_dim: int = 2,
+    nb_points: int = 4097,
+) -> Tuple[float, float]:
+    # Error of a fitted model at the operating point: the value of the dim where the model reaches wfc_target (the
+    # closest point of a dense grid) and |WFC - wfc_target| of the actual color there. Unlike the fits' MSE, it does
+    # not depend on where the samples were taken, so uniform and adaptive samples can be compared on it.
+    grid = np.linspace(0.0, 1.0, nb_points)
+    with np.errstate(all="ignore"):
+        x_target = grid[np.nanargmin(np.abs(model(grid) - wfc_target))]
+    wfc = _evaluate(rgb_base, rgb_ref, x_target, color_space_conv, color_space_conv_inv, color_space_dim)
+    return x_target, abs(wfc - wfc_target)
+
 
+def _samples(
+    rgb_base: RGB,
+    rgb_ref: RGB,
+    nb_samples: int,
+    color_space_conv: Callable[[RGB], ColorSpace],
+    color_space_conv_inv: Callable[[ColorSpace], RGB],
+    color_space_dim: int,
+    wfc_target: Optional[float],
+) -> Tuple[np.ndarray[float], np.ndarray[float]]:
+    if wfc_target is None:
+        return weber_fechner_samples(
+            rgb_base, rgb_ref, nb_samples, color_space_conv, color_space_conv_inv, color_space_dim
+        )
+    return weber_fechner_adaptive_samples(
+        rgb_base,
+        rgb_ref,
+        wfc_target,
+        nb_samples,
+        color_space_conv=color_space_conv,
+        color_space_conv_inv=color_space_conv_inv,
+        color_space_dim=color_space_dim,
+    )
+
+
+# Fits on already computed samples, so that several models can share the same (x, y).
+def linfit(x: np.ndarray[float], y: np.ndarray[float]) -> Tuple[float, float, float]:
     # Fitting on linear ax + b
     a, b = np.polyfit(x, y, 1)
-    mse = 1 / nb_samples * np.sum(np.pow(y - (a * x + b), 2))
+    mse = 1 / len(x) * np.sum(np.pow(y - (a * x + b), 2))
+    return a, b, mse
+
+
+def logfit(x: np.ndarray[float], y: np.ndarray[float], normalize: bool = True) -> Tuple[float, float, float]:
+    # Fitting on logarithmic y = a + b * log(x)
+    # Normalizing on x is only adding an epsilon since the first value can be 0, the error is measured the same way.
+    log_x = np.log(x + 1e-5) if normalize else np.log(x)
+    finite = np.isfinite(log_x)
+    a, b = np.polyfit(x=log_x[finite], y=y[finite], deg=1)
+
+    mse = 1 / len(x) * np.sum(np.pow(y[finite] - (a * log_x[finite] + b), 2))
     return a, b, mse
 
 
+def expfit(
+    x: np.ndarray[float], y: np.ndarray[float], normalize: bool = True, weighted_least_squares: bool = False
+) -> Tuple[float, float, float]:
+    # Fitting on exponential y = ae^(bx)
+    # Normalizing on y is adding 1 since the values for oklab are within [-1; inf].
+    # Samples whose log is not finite (e.g. black, at y = -1) are left out of the regression.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_y = np.log(y + 1) if normalize else np.log(y)
+    finite = np.isfinite(log_y)
+    a, b = np.polyfit(
+        x=x[finite],
+        y=log_y[finite],
+        deg=1,
+        w=np.sqrt(y[finite] + 1) if weighted_least_squares else None,
+    )
+    b = np.exp(b)
+    mse = 1 / len(x) * np.sum(np.pow(y - (b * np.exp(a * x) - (1 if normalize else 0)), 2))
+    return a, b, mse
+
+
+def weber_fechner_fit(
+    rgb_base: RGB,
+    rgb_ref: RGB,
+    nb_samples: int = 32,
+    color_space_conv: Callable[[RGB], ColorSpace] = lambda rgb: RGB.to_hsl(rgb),
+    color_space_conv_inv: Callable[[ColorSpace], RGB] = lambda hsl: HSL.to_rgb(hsl),
+    color_space_dim: int = 2,
+    wfc_target: Optional[float] = None,
+) -> Tuple[float, float, float]:
+    x, y = _samples(rgb_base, rgb_ref, nb_samples, color_space_conv, color_space_conv_inv, color_space_dim, wfc_target)
+    return linfit(x, y)
+
+
 def weber_fechner_logfit(
     rgb_base: RGB,
     rgb_ref: RGB,
@@ -67,15 +204,10 @@ def weber_fechner_logfit(
     color_space_conv_inv: Callable[[ColorSpace], RGB] = lambda hsl: HSL.to_rgb(hsl),
     color_space_dim: int = 2,
     normalize: bool = True,
+    wfc_target: Optional[float] = None,
 ) -> Tuple[float, float]:
-    x, y = weber_fechner_samples(rgb_base, rgb_ref, nb_samples, color_space_conv, color_space_conv_inv, color_space_dim)
-
-    # Fitting on logarithmic y = a + b * log(x)
-    # Normalizing on x is only adding an epsilon since the first value can be 0.
-    a, b = np.polyfit(x=np.log(x + 1e-5) if normalize else x, y=y, deg=1)
-
-    mse = 1 / nb_samples * np.sum(np.pow(y - (a * np.log(x) + b), 2))
-    return a, b, mse
+    x, y = _samples(rgb_base, rgb_ref, nb_samples, color_space_conv, color_space_conv_inv, color_space_dim, wfc_target)
+    return logfit(x, y, normalize)
 
 
 def weber_fechner_expfit(
@@ -87,14 +219,7 @@ def weber_fechner_expfit(
     color_space_dim: int = 2,
     normalize: bool = True,
     weighted_least_squares: bool = False,
+    wfc_target: Optional[float] = None,
 ) -> Tuple[float, float]:
-    x, y = weber_fechner_samples(rgb_base, rgb_ref, nb_samples, color_space_conv, color_space_conv_inv, color_space_dim)
-
-    # Fitting on exponential y = ae^(bx)
-    # Normalizing on y is adding 1 since the values for oklab are within [-1; inf].
-    a, b = np.polyfit(
-        x=x, y=np.log(y + 1) if normalize else np.log(y), deg=1, w=np.sqrt(y + 1) if weighted_least_squares else None
-    )
-    b = np.exp(b)
-    mse = 1 / nb_samples * np.sum(np.pow(y - (b * np.exp(a * x) - (1 if normalize else 0)), 2))
-    return a, b, mse
+    x, y = _samples(rgb_base, rgb_ref, nb_samples, color_space_conv, color_space_conv_inv, color_space_dim, wfc_target)
+    return expfit(x, y, normalize, weighted_least_squares)
@@ -1,62 +1,111 @@
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 
-from .contrast import weber_fechner_expfit, weber_fechner_fit, weber_fechner_samples
+from .contrast import expfit, linfit, logfit, weber_fechner_samples
 from .spaces.hsl import HSLstd
 from .spaces.hsv import HSVstd
 from .spaces.oklab import OKLAB
 from .spaces.rgb import RGB
 
 
-def weber_fechner_plot(rgb_base: RGB, rgb_ref: RGB, wfc_s: float, nb_samples: int = 32):
-    plt.figure(figsize=(16, 10))
-    plt.scatter([], [], color="black", label="Samples")
-    plt.hlines(wfc_s, 0.0, 1.0, colors="black", label="Target")
-
+def weber_fechner_models(rgb_base: RGB, rgb_ref: RGB, nb_samples: int = 32) -> Dict[str, Dict[str, Any]]:
+    # Sampling once per (space, dim) and fitting every model of that space on the same samples.
     hslstd_x, hslstd_y = weber_fechner_samples(rgb_base, rgb_ref, nb_samples, RGB.to_hslstd, HSLstd.to_rgb, 2)
-    hslstd_a, hslstd_b, hslstd_mse = weber_fechner_fit(rgb_base, rgb_ref, nb_samples, RGB.to_hslstd, HSLstd.to_rgb, 2)
+    hsvstd_x, hsvstd_y = weber_fechner_samples(rgb_base, rgb_ref, nb_samples, RGB.to_hsvstd, HSVstd.to_rgb, 2)
+    oklab_x, oklab_y = weber_fechner_samples(rgb_base, rgb_ref, nb_samples, RGB.to_oklab, OKLAB.to_rgb, 0)
+    return {
+        "hslstd": {
+            "x": hslstd_x,
+            "y": hslstd_y,
+            "fit": linfit(hslstd_x, hslstd_y),
+            "logfit": logfit(hslstd_x, hslstd_y),
+        },
+        "hsvstd": {
+            "x": hsvstd_x,
+            "y": hsvstd_y,
+            "fit": linfit(hsvstd_x, hsvstd_y),
+            "logfit": logfit(hsvstd_x, hsvstd_y),
+        },
+        "oklab": {
+            "x": oklab_x,
+            "y": oklab_y,
+            "expfit": expfit(oklab_x, oklab_y, normalize=True),
+            "wexpfit": expfit(oklab_x, oklab_y, normalize=True, weighted_least_squares=True),
+        },
+    }
+
+
+def _weber_fechner_draw(ax: Axes, models: Dict[str, Dict[str, Any]], wfc_s: float, nb_samples: int = 32):
+    ax.scatter([], [], color="black", label="Samples")
+    ax.hlines(wfc_s, 0.0, 1.0, colors="black", label="Target")
+
+    hslstd_x, hslstd_y = models["hslstd"]["x"], models["hslstd"]["y"]
+    hslstd_a, hslstd_b, hslstd_mse = models["hslstd"]["fit"]
     x_curve = np.linspace(min(hslstd_x), max(hslstd_x), nb_samples)
     y_curve = hslstd_a * x_curve + hslstd_b
-    plt.plot(
+    ax.plot(
         x_curve,
         y_curve,
         color="blue",
         label=f"WFC HSLstd on L (MSE={hslstd_mse:.2f}): y = {hslstd_a:.2f}x + {hslstd_b:.2f}",
         linewidth=1,
     )
-    plt.scatter(hslstd_x, hslstd_y, color="blue")
+    hslstd_la, hslstd_lb, hslstd_lmse = models["hslstd"]["logfit"]
+    y_curve = hslstd_la * np.log(x_curve + 1e-5) + hslstd_lb
+    ax.plot(
+        x_curve,
+        y_curve,
+        color="blue",
+        linestyle="--",
+        label=f"WFC HSLstd on L (MSE={hslstd_lmse:.2f}): y = {hslstd_la:.2f}log(x) + {hslstd_lb:.2f}",
+        linewidth=1,
+    )
+    ax.scatter(hslstd_x, hslstd_y, color="blue")
 
-    hsvstd_x, hsvstd_y = weber_fechner_samples(rgb_base, rgb_ref, nb_samples, RGB.to_hsvstd, HSVstd.to_rgb, 2)
-    hsvstd_a, hsvstd_b, hsvstd_mse = weber_fechner_fit(rgb_base, rgb_ref, nb_samples, RGB.to_hsvstd, HSVstd.to_rgb, 2)
+    hsvstd_x, hsvstd_y = models["hsvstd"]["x"], models["hsvstd"]["y"]
+    hsvstd_a, hsvstd_b, hsvstd_mse = models["hsvstd"]["fit"]
     x_curve = np.linspace(min(hsvstd_x), max(hsvstd_x), nb_samples)
     y_curve = hsvstd_a * x_curve + hsvstd_b
-    plt.plot(
+    ax.plot(
         x_curve,
         y_curve,
         color="green",
         label=f"WFC HSVstd on V (MSE={hsvstd_mse:.2f}): y = {hsvstd_a:.2f}x + {hsvstd_b:.2f}",
         linewidth=1,
     )
-    plt.scatter(hsvstd_x, hsvstd_y, color="green")
-
-    oklab_x, oklab_y = weber_fechner_samples(rgb_base, rgb_ref, nb_samples, RGB.to_oklab, OKLAB.to_rgb, 0)
-    oklab_a, oklab_b, oklab_mse = weber_fechner_expfit(
-        rgb_base, rgb_ref, nb_samples, RGB.to_oklab, OKLAB.to_rgb, 0, normalize=True
+    hsvstd_la, hsvstd_lb, hsvstd_lmse = models["hsvstd"]["logfit"]
+    y_curve = hsvstd_la * np.log(x_curve + 1e-5) + hsvstd_lb
+    ax.plot(
+        x_curve,
+        y_curve,
+        color="green",
+        linestyle="--",
+        label=f"WFC HSVstd on V (MSE={hsvstd_lmse:.2f}): y = {hsvstd_la:.2f}log(x) + {hsvstd_lb:.2f}",
+        linewidth=1,
     )
+    ax.scatter(hsvstd_x, hsvstd_y, color="green")
+
+    oklab_x, oklab_y = models["oklab"]["x"], models["oklab"]["y"]
+    oklab_a, oklab_b, oklab_mse = models["oklab"]["expfit"]
     x_curve = np.linspace(min(oklab_x), max(oklab_x), nb_samples)
     y_curve = oklab_b * np.exp(oklab_a * x_curve) - 1
-    plt.plot(
+    ax.plot(
         x_curve,
         y_curve,
         color="red",
         label=f"WFC OkLab on L (MSE={oklab_mse:.2f}): y = {oklab_a:.2f}e({oklab_b:.2f}x)",
         linewidth=1,
     )
-    oklab_wa, oklab_wb, oklab_wmse = weber_fechner_expfit(
-        rgb_base, rgb_ref, nb_samples, RGB.to_oklab, OKLAB.to_rgb, 0, normalize=True, weighted_least_squares=True
-    )
+    oklab_wa, oklab_wb, oklab_wmse = models["oklab"]["wexpfit"]
     y_curve = oklab_wb * np.exp(oklab_wa * x_curve) - 1
-    plt.plot(
+    ax.plot(
         x_curve,
         y_curve,
         color="darkred",
@@ -64,11 +113,48 @@ def weber_fechner_plot(rgb_base: RGB, rgb_ref: RGB, wfc_s: float, nb_samples: in
             {oklab_wa:.2f}e({oklab_wb:.2f}x)",
         linewidth=1,
     )
-    plt.scatter(oklab_x, oklab_y, color="red")
+    ax.scatter(oklab_x, oklab_y, color="red")
+
+    ax.set_title("Numpy polyfit based on WFC in different spaces and dimensions")
+    ax.set_xlabel("Modified dimension ([0; 1])")
+    ax.set_ylabel("Weber Feshner Contrast")
+    ax.legend()
+    ax.grid(True)
+
 
-    plt.title("Numpy polyfit based on WFC in different spaces and dimensions")
-    plt.xlabel("Modified dimension ([0; 1])")
-    plt.ylabel("Weber Feshner Contrast")
-    plt.legend()
-    plt.grid(True)
+def weber_fechner_plot(rgb_base: RGB, rgb_ref: RGB, wfc_s: float, nb_samples: int = 32):
+    plt.figure(figsize=(16, 10))
+    _weber_fechner_draw(plt.gca(), weber_fechner_models(rgb_base, rgb_ref, nb_samples), wfc_s, nb_samples)
     plt.show()
+
+
+def weber_fechner_report(rgb_base: RGB, rgb_ref: RGB, wfc_s: float, path: str | Path, nb_samples: int = 32) -> Path:
+    # Headless counterpart of weber_fechner_plot: the figure is rendered by the Agg canvas, without pyplot nor any
+    # display, and saved to path (the format, e.g. PNG or SVG, following its suffix).
+    figure = Figure(figsize=(16, 10))
+    FigureCanvasAgg(figure)
+    _weber_fechner_draw(figure.add_subplot(), weber_fechner_models(rgb_base, rgb_ref, nb_samples), wfc_s, nb_samples)
+    figure.savefig(path)
+    return Path(path)
+
+
+def _weber_fechner_report_star(args: Tuple[RGB, RGB, float, Path, int]) -> Path:
+    return weber_fechner_report(*args)
+
+
+def weber_fechner_reports(
+    pairs: Iterable[Tuple[RGB, RGB, float]],
+    output_dir: str | Path,
+    nb_samples: int = 32,
+    extension: str = "png",
+    processes: Optional[int] = None,
+) -> List[Path]:
+    # One report per (rgb_base, rgb_ref, wfc_s), rendered in parallel worker processes and named by index.
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    jobs = [
+        (rgb_base, rgb_ref, wfc_s, output_dir / f"report_{index:05d}.{extension}", nb_samples)
+        for index, (rgb_base, rgb_ref, wfc_s) in enumerate(pairs)
+    ]
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        return list(executor.map(_weber_fechner_report_star, jobs, chunksize=max(1, len(jobs) // 64)))
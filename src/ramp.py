@@ -0,0 +1,77 @@
+from typing import Callable, Tuple
+
+import numpy as np
+
+from .contrast import weber_fechner_contrast
+from .spaces.oklab import OKLAB
+from .spaces.rgb import RGB
+
+
+def weber_fechner_ramps(
+    rgb_base: RGB,
+    rgb_bg: RGB,
+    nb_steps: int = 10,
+    contrast_min: float | np.ndarray[float] = 0.0,
+    lightness_range: Tuple[float, float] = (0.05, 0.95),
+    contrast: Callable[[RGB, RGB], np.ndarray[float]] = weber_fechner_contrast,
+    iterations: int = 24,
+) -> Tuple[RGB, np.ndarray[bool]]:
+    # Tint/shade ramps of nb_steps colors evenly spaced in OkLab L (base a and b kept, then gamut mapped), for every
+    # base color at once. Base and background colors broadcast against each other: (N, 3) bases on a (3,) background,
+    # or bases[:, None] on backgrounds[None] for every (base, background) pair.
+    # Steps whose |contrast| on their background is under contrast_min (a scalar or one value per step) are pushed
+    # away from the background lightness, the steps of a ramp on the same side of it together: their L are scaled
+    # towards L = 0 (or 1) by the largest factor keeping every step within its own feasible L, found by bisection,
+    # so that they stay distinct and in order. Returns the (..., nb_steps, 3) ramps and whether each step meets its
+    # threshold (False when even L = 0 or 1 is not enough, or when it renders as the same 8 bits color as the
+    # previous step). OkLab is taken on D65 XYZ, so that the steps of a gray base stay gray.
+    lab_base = np.asarray(rgb_base.to_oklab(bradford_adapted_d50=False).values, dtype=np.float64)
+    lab_bg = np.asarray(rgb_bg.to_oklab(bradford_adapted_d50=False).values, dtype=np.float64)
+    rgb_bg_values = np.asarray(rgb_bg.values, dtype=np.float64)
+    shape = np.broadcast_shapes(lab_base.shape[:-1], lab_bg.shape[:-1]) + (nb_steps,)
+
+    L = np.broadcast_to(np.linspace(*lightness_range, nb_steps), shape).ravel()
+    a = np.broadcast_to(lab_base[..., None, 1], shape).ravel()
+    b = np.broadcast_to(lab_base[..., None, 2], shape).ravel()
+    L_bg = np.broadcast_to(lab_bg[..., None, 0], shape).ravel()
+    bg = RGB(np.broadcast_to(rgb_bg_values[..., None, :], shape + (3,)).reshape(-1, 3))
+    threshold = np.broadcast_to(contrast_min, shape).ravel()
+
+    def render(L: np.ndarray[float], index: np.ndarray[int]) -> np.ndarray[float]:
+        lab = OKLAB(np.stack([L, a[index], b[index]], axis=-1)).gamut_map(bradford_adapted_d50=False)
+        return np.clip(lab.to_rgb(bradford_adapted_d50=False).values, 0, 1)
+
+    def meets(L: np.ndarray[float], index: np.ndarray[int]) -> np.ndarray[bool]:
+        return np.abs(contrast(RGB(render(L, index)), RGB(bg.values[index]))) >= threshold[index]
+
+    # Bound of the L meeting the threshold on the side of the background each step is on: the highest L below it (down
+    # to L = 0) or the lowest L above it (up to L = 1), solved by bisection for every step at once.
+    index = np.arange(len(L))
+    light = L >= L_bg
+    edge = np.where(light, 1.0, 0.0)
+    reachable = meets(edge, index)
+    near, far = L_bg.copy(), edge.copy()
+    for _ in range(iterations):
+        middle = (near + far) / 2
+        ok = meets(middle, index)
+        far = np.where(ok, middle, far)
+        near = np.where(ok, near, middle)
+
+    # Every step is scaled towards the edge of its side by the same factor, the largest one (up to 1, i.e. unchanged)
+    # keeping the reachable steps of that side within their bound. Unreachable steps follow the others but stay unmet.
+    distance = np.abs(L - edge).reshape(-1, nb_steps)
+    bound = np.abs(far - edge).reshape(-1, nb_steps)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.where(reachable.reshape(-1, nb_steps) & (distance > 0), bound / distance, np.inf)
+    light = light.reshape(-1, nb_steps)
+    scale = np.stack(
+        [np.minimum(1.0, np.where(light == side, ratio, np.inf).min(axis=-1)) for side in (False, True)], axis=-1
+    )
+    scale = np.take_along_axis(scale, light.astype(int), axis=-1).ravel()
+    L = edge + (L - edge) * scale
+
+    rgb = render(L, index).reshape(-1, nb_steps, 3)
+    met = meets(L, index).reshape(-1, nb_steps) & reachable.reshape(-1, nb_steps)
+    collapsed = np.all(np.round(rgb[:, 1:] * 255) == np.round(rgb[:, :-1] * 255), axis=-1)
+    met[:, 1:] &= ~collapsed
+    return RGB(rgb.reshape(shape + (3,))), met.reshape(shape)
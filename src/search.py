@@ -0,0 +1,184 @@
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .contrast import LUMINANCE_WEIGHTS, luminance, weber_fechner_contrast
+from .spaces.oklab import GAMUT_EPSILON, OKLAB, Oklab_LMS_matrix_inv, Oklab_matrix_inv
+from .spaces.rgb import RGB
+from .spaces.xyz import xyz_to_rgb_adapted_matrix
+
+MAX_CHROMA: float = 0.4
+
+
+def _oklch_to_oklab(lch: np.ndarray[float]) -> np.ndarray[float]:
+    L, C, h = lch[..., 0], lch[..., 1], lch[..., 2]
+    return np.stack([L, C * np.cos(h), C * np.sin(h)], axis=-1)
+
+
+def _oklab_to_oklch(lab: np.ndarray[float]) -> np.ndarray[float]:
+    L, a, b = lab[..., 0], lab[..., 1], lab[..., 2]
+    return np.stack([L, np.hypot(a, b), np.arctan2(b, a)], axis=-1)
+
+
+def _evaluate(
+    lch: np.ndarray[float], rgb_bg: RGB, wfc_target: float, oklab_ref: np.ndarray[float]
+) -> Tuple[np.ndarray[float], np.ndarray[float], np.ndarray[bool], np.ndarray[float]]:
+    # Scoring a (N, 3) batch of OkLCh candidates at once: RGB values, contrast error, gamut mask and distance to ref.
+    lab = _oklch_to_oklab(lch)
+    rgb = OKLAB(lab).to_rgb().values
+    with np.errstate(invalid="ignore"):
+        wfc = weber_fechner_contrast(RGB(rgb), rgb_bg)
+    in_gamut = np.all((rgb >= -GAMUT_EPSILON) & (rgb <= 1 + GAMUT_EPSILON), axis=-1)
+    distance = np.linalg.norm(lab - oklab_ref, axis=-1)
+    return rgb, np.abs(wfc - wfc_target), in_gamut, distance
+
+
+def _select(
+    contrast_error: np.ndarray[float], in_gamut: np.ndarray[bool], distance: np.ndarray[float], tolerance: float
+) -> int:
+    # Closest in-gamut candidate meeting the contrast target, or the in-gamut candidate closest to the target.
+    feasible = in_gamut & (contrast_error <= tolerance)
+    if np.any(feasible):
+        return int(np.argmin(np.where(feasible, distance, np.inf)))
+    return int(np.argmin(np.where(in_gamut, contrast_error, np.inf)))
+
+
+def _grid(axes: list[np.ndarray[float]]) -> np.ndarray[float]:
+    return np.stack(np.meshgrid(*axes, indexing="ij"), axis=-1).reshape(-1, len(axes))
+
+
+def _solve_lightness(
+    ch: np.ndarray[float], rgb_bg: RGB, wfc_target: float, grid: np.ndarray[float], iterations: int = 5
+) -> np.ndarray[float]:
+    # Contrast is monotone in L for a fixed chroma and hue, so for every (C, h) candidate the L reaching the target is
+    # bracketed on an increasing L grid, (K,) or one (N, K) row per candidate (a single vectorized evaluation), then
+    # refined by false position (Illinois variant) within its bracket, on the clipped sRGB color. Candidates whose
+    # target is not within their grid end on its first or last L (L = 0 or 1 for a grid spanning [0; 1]).
+    # The contrast only depends on the luminance of the clipped color, computed in linear sRGB (clipping there is the
+    # same as clipping the encoded values) with the a, b part of the OkLab to LMS' product done once per candidate.
+    lmsp_ab = ch[:, :1] * (np.cos(ch[:, 1:]) * Oklab_matrix_inv[:, 1] + np.sin(ch[:, 1:]) * Oklab_matrix_inv[:, 2])
+    lms_to_rgb = xyz_to_rgb_adapted_matrix("sRGB") @ Oklab_LMS_matrix_inv
+    luminance_bg = luminance(rgb_bg)
+
+    def contrast(L: np.ndarray[float], lmsp_ab: np.ndarray[float]) -> np.ndarray[float]:
+        lmsp = L[..., None] * Oklab_matrix_inv[:, 0] + lmsp_ab
+        lms = (lmsp * lmsp * lmsp).reshape(-1, 3)
+        rgb = np.clip(lms @ lms_to_rgb.T, 0, 1)
+        return ((rgb @ LUMINANCE_WEIGHTS - luminance_bg) / luminance_bg - wfc_target).reshape(lmsp.shape[:-1])
+
+    grid = np.broadcast_to(grid, (len(ch), np.shape(grid)[-1]))
+    table = contrast(grid, lmsp_ab[:, None, :])
+    rows = np.arange(len(ch))
+    index = (table < 0).sum(axis=-1)
+    unreachable = (index == 0) | (index == grid.shape[-1])
+    index = np.clip(index, 1, grid.shape[-1] - 1)
+    low, high = grid[rows, index - 1], grid[rows, index]
+    f_low, f_high = table[rows, index - 1], table[rows, index]
+
+    side = np.zeros(len(ch))
+    for _ in range(iterations):
+        denominator = np.where(f_high == f_low, 1.0, f_high - f_low)
+        middle = np.clip(low - f_low * (high - low) / denominator, low, high)
+        f_middle = contrast(middle, lmsp_ab)
+        below = f_middle < 0
+        # Halving the value kept on the same side twice in a row avoids the one-sided convergence of false position.
+        f_high = np.where(below & (side < 0), f_high / 2, f_high)
+        f_low = np.where(~below & (side > 0), f_low / 2, f_low)
+        low, f_low = np.where(below, middle, low), np.where(below, f_middle, f_low)
+        high, f_high = np.where(below, high, middle), np.where(below, f_high, f_middle)
+        side = np.where(below, -1, 1)
+
+    L = np.where(np.abs(f_low) < np.abs(f_high), low, high)
+    return np.where(unreachable, np.where(index == 1, grid[:, 0], grid[:, -1]), L)
+
+
+def weber_fechner_search(
+    rgb_fg_ref: RGB,
+    rgb_bg: RGB,
+    wfc_target: float,
+    tolerance: float = 1e-3,
+    grid_size: int = 48,
+    hue_range: float = 0.0,
+    hue_grid_size: int = 7,
+    refine_iterations: int = 2,
+    refine_grid_size: int = 9,
+    refine_candidates: int = 4,
+    lightness_grid_size: int = 17,
+) -> Tuple[RGB, float, float]:
+    # Jointly searching OkLab L and chroma (and hue within +/- hue_range radians if given) for the in-gamut color the
+    # closest to the reference foreground that reaches the target contrast on rgb_bg. L is solved for every (C, h) of
+    # a vectorized coarse grid, then finer grids are centered on the best few candidates with a shrinking window.
+    # The L of a refined candidate is bracketed within two coarse L steps of the L solved for its center, instead of
+    # on the whole [0; 1] grid again.
+    oklab_ref = np.asarray(rgb_fg_ref.to_oklab().values, dtype=np.float64)
+    _, _, hue_ref = _oklab_to_oklch(oklab_ref)
+
+    axes = [np.linspace(0.0, MAX_CHROMA, grid_size)]
+    steps = [MAX_CHROMA / (grid_size - 1)]
+    if hue_range > 0:
+        axes.append(hue_ref + np.linspace(-hue_range, hue_range, hue_grid_size))
+        steps.append(2 * hue_range / (hue_grid_size - 1))
+    else:
+        axes.append(np.array([hue_ref]))
+        steps.append(0.0)
+    bounds = [(0.0, MAX_CHROMA), (hue_ref - hue_range, hue_ref + hue_range)]
+    ch = _grid(axes)
+    L_grid = np.linspace(0.0, 1.0, lightness_grid_size)
+    L_window = np.linspace(-2.0, 2.0, 5) / (lightness_grid_size - 1)
+
+    evaluated = []
+    for iteration in range(refine_iterations + 1):
+        L = _solve_lightness(ch, rgb_bg, wfc_target, L_grid)
+        rgb, contrast_error, in_gamut, distance = _evaluate(np.column_stack([L, ch]), rgb_bg, wfc_target, oklab_ref)
+        evaluated.append((rgb, contrast_error, in_gamut, distance))
+        if iteration == refine_iterations:
+            break
+
+        # Next grid spans one previous step on each side of the best few candidates, clipped to the search bounds.
+        score = np.where(in_gamut & (contrast_error <= tolerance), distance, np.inf)
+        if not np.any(np.isfinite(score)):
+            score = np.where(in_gamut, MAX_CHROMA + contrast_error, np.inf)
+        best = np.argsort(score)[:refine_candidates]
+        children = [
+            _grid(
+                [
+                    np.linspace(max(low, c - step), min(high, c + step), refine_grid_size if step > 0 else 1)
+                    for c, step, (low, high) in zip(center, steps, bounds)
+                ]
+            )
+            for center in ch[best]
+        ]
+        L_grid = np.clip(np.repeat(L[best], [len(child) for child in children])[:, None] + L_window, 0.0, 1.0)
+        ch = np.concatenate(children)
+        steps = [2 * step / (refine_grid_size - 1) for step in steps]
+
+    rgb, contrast_error, in_gamut, distance = (np.concatenate(values) for values in zip(*evaluated))
+    if not np.any(in_gamut):
+        raise ValueError("No in-gamut candidate found.")
+    index = _select(contrast_error, in_gamut, distance, tolerance)
+    return RGB(np.clip(rgb[index], 0, 1)), float(contrast_error[index]), float(distance[index])
+
+
+def weber_fechner_match(
+    rgb_fg: RGB, rgb_bg: RGB, wfc_target: float, iterations: int = 32, oklab_fg: Optional[OKLAB] = None
+) -> RGB:
+    # Batched counterpart of the single-axis fits: for every (fg, bg) row, bisecting the OkLab L of fg (a and b kept)
+    # until the clipped sRGB color reaches the target contrast on bg. Rows that cannot reach it end on L = 0 or 1.
+    # OkLab is taken on D65 XYZ (no Bradford adaptation) so that grays, black included, stay neutral when their L
+    # moves. oklab_fg, if given, is that OkLab of rgb_fg, already computed (e.g. by batch.convert_chunks).
+    oklab_fg = rgb_fg.to_oklab(bradford_adapted_d50=False) if oklab_fg is None else oklab_fg
+    lab = np.array(oklab_fg.values, dtype=np.float64, ndmin=2)
+    low = np.zeros(len(lab))
+    high = np.ones(len(lab))
+
+    def to_rgb(L: np.ndarray[float]) -> np.ndarray[float]:
+        oklab = OKLAB(np.stack([L, lab[:, 1], lab[:, 2]], axis=-1))
+        return np.clip(oklab.to_rgb(bradford_adapted_d50=False).values, 0, 1)
+
+    for _ in range(iterations):
+        middle = (low + high) / 2
+        below = weber_fechner_contrast(RGB(to_rgb(middle)), rgb_bg) < wfc_target
+        low = np.where(below, middle, low)
+        high = np.where(below, high, middle)
+
+    return RGB(to_rgb((low + high) / 2).reshape(np.shape(rgb_fg.values)))
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import numbers
 from abc import ABC
-from typing import Any
+from typing import Any, Callable
 
 import numpy as np
 from typing_extensions import Self
@@ -71,36 +72,61 @@ class CartesianColorSpace(ColorSpace, ABC):
 
 
 class CylindricalColorSpace(ColorSpace, ABC):
+    # Values are (H, S, L/V) with H in [0; 1]. Operations are done on the (..., 3) arrays at once, through the
+    # cartesian form (S * cos(2 * pi * H), S * sin(2 * pi * H), L/V) of the cylinder.
     @staticmethod
-    def _cylindrical_to_cartesian(r: float, theta: float, z: float) -> np.ndarray[float]:
-        x = r * np.cos(theta)
-        y = r * np.sin(theta)
-        return np.array([x, y, z])
+    def _cylindrical_to_cartesian(values: np.ndarray[float]) -> np.ndarray[float]:
+        values = np.asarray(values, dtype=np.float64)
+        theta = 2 * np.pi * values[..., 0]
+        return np.stack([values[..., 1] * np.cos(theta), values[..., 1] * np.sin(theta), values[..., 2]], axis=-1)
 
     @staticmethod
-    def _cartesian_to_cylindrical(x: float, y: float, z: float) -> np.ndarray[float]:
-        r = np.sqrt(x**2 + y**2)
-        theta = np.arctan2(y, x)
-        return np.array([r, theta, z])
-
-    def __add__(self, other: Self) -> Self:
-        if type(self) is not type(other):
+    def _cartesian_to_cylindrical(values: np.ndarray[float]) -> np.ndarray[float]:
+        values = np.asarray(values, dtype=np.float64)
+        H = (np.arctan2(values[..., 1], values[..., 0]) / (2 * np.pi)) % 1
+        S = np.hypot(values[..., 0], values[..., 1])
+        return np.stack([H, S, values[..., 2]], axis=-1)
+
+    def _operation(self, other: Self | float, operation: Callable[[np.ndarray, Any], np.ndarray]) -> Self:
+        a = self._cylindrical_to_cartesian(self.values)
+        if type(self) is type(other):
+            b = self._cylindrical_to_cartesian(other.values)
+        elif isinstance(other, (numbers.Real, np.number)):
+            b = other
+        else:
             raise ValueError("Cannot use operation on different ColorSpace.")
-        a = self._cylindrical_to_cartesian(*self.values)
-        b = self._cylindrical_to_cartesian(*other.values)
-        c = self._cartesian_to_cylindrical(*(a + b))
-        return type(self)(c)
+        return type(self)(self._cartesian_to_cylindrical(operation(a, b)))
 
-    def __sub__(self, other: Self) -> Self:
-        if type(self) is not type(other):
-            raise ValueError("Cannot use operation on different ColorSpace.")
-        a = self._cylindrical_to_cartesian(*self.values)
-        b = self._cylindrical_to_cartesian(*other.values)
-        c = self._cartesian_to_cylindrical(*(a - b))
-        return type(self)(c)
+    def __add__(self, other: Self | float) -> Self:
+        return self._operation(other, np.add)
+
+    def __sub__(self, other: Self | float) -> Self:
+        return self._operation(other, np.subtract)
+
+    def __mul__(self, other: Self | float) -> Self:
+        return self._operation(other, np.multiply)
+
+    def __truediv__(self, other: Self | float) -> Self:
+        return self._operation(other, np.divide)
 
     def __neg__(self) -> Self:
         return type(self)(-self.values)
 
     def __abs__(self) -> Self:
         return type(self)(abs(self.values))
+
+    def interpolate(self, other: Self, t: float | np.ndarray[float]) -> Self:
+        # Linear interpolation of S and L/V, the hue going along the shortest arc (wrapping around 0/1). For a t of
+        # shape (T,), the result is a (T, ..., 3) gradient.
+        if type(self) is not type(other):
+            raise ValueError("Cannot use operation on different ColorSpace.")
+        a = np.asarray(self.values, dtype=np.float64)
+        b = np.asarray(other.values, dtype=np.float64)
+        t = np.asarray(t, dtype=np.float64)
+        t = t.reshape(t.shape + (1,) * (len(np.broadcast_shapes(a.shape, b.shape)) - 1))
+
+        dH = (b[..., 0] - a[..., 0] + 0.5) % 1 - 0.5
+        H = (a[..., 0] + t * dH) % 1
+        S = a[..., 1] + t * (b[..., 1] - a[..., 1])
+        Z = a[..., 2] + t * (b[..., 2] - a[..., 2])
+        return type(self)(np.stack([H, S, Z], axis=-1))
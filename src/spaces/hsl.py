@@ -14,6 +14,8 @@ if TYPE_CHECKING:
 class HSL(CylindricalColorSpace):
     @staticmethod
     def from_rgb(rgb: RGB) -> HSL:
+        if np.ndim(rgb.values) > 1:
+            return HSL(HSL._from_rgb_batch(np.asarray(rgb.values, dtype=np.float64)))
         R, G, B = rgb.values
         M = max(R, G, B)
         m = min(R, G, B)
@@ -38,6 +40,10 @@ class HSL(CylindricalColorSpace):
         return HSL(np.array([H, S, L]))
 
     def to_rgb(self) -> RGB:
+        if np.ndim(self.values) > 1:
+            from .rgb import RGB
+
+            return RGB(self._to_rgb_batch(np.asarray(self.values, dtype=np.float64)))
         H, S, L = self.values
         if S == 0:
             R = G = B = L  # achromatic
@@ -64,16 +70,102 @@ class HSL(CylindricalColorSpace):
             return p + (q - p) * (2 / 3 - t) * 6
         return p
 
+    # Batched (N, 3) counterparts of the conversions above, following the exact same branches.
+    @staticmethod
+    def _from_rgb_batch(rgb: np.ndarray[float]) -> np.ndarray[float]:
+        R, G, B = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+        M = rgb.max(axis=-1)
+        m = rgb.min(axis=-1)
+        C = M - m
+        C_safe = np.where(C == 0, 1, C)
+
+        H = np.select(
+            [C == 0, M == R, M == G],
+            [0, ((G - B) / C_safe) % 6, ((B - R) / C_safe) + 2],
+            ((R - G) / C_safe) + 4,
+        )
+        H = H / 6
+
+        L = 1 / 2 * C
+
+        edge = (L == 1) | (L == 0)
+        S = np.where(edge, 0, C / np.where(edge, 1, 1 - abs(2 * L - 1)))
+
+        return np.stack([H, S, L], axis=-1)
+
+    @staticmethod
+    def _to_rgb_batch(hsl: np.ndarray[float]) -> np.ndarray[float]:
+        H, S, L = hsl[..., 0], hsl[..., 1], hsl[..., 2]
+        q = np.where(L < 0.5, L * (1 + S), L + S - L * S)
+        p = 2 * L - q
+
+        def hue_to_rgb(t: np.ndarray[float]) -> np.ndarray[float]:
+            return np.select(
+                [t < 0, t > 1, t < 1 / 6, t < 1 / 2, t < 2 / 3],
+                [p, p, p + (q - p) * 6 * t, q, p + (q - p) * (2 / 3 - t) * 6],
+                p,
+            )
+
+        rgb = np.stack([hue_to_rgb(H + 1 / 3), hue_to_rgb(H), hue_to_rgb(H - 1 / 3)], axis=-1)
+        return np.where((S == 0)[..., None], L[..., None], rgb)
+
 
 class HSLstd(CylindricalColorSpace):
     @staticmethod
     def from_rgb(rgb: RGB) -> HSLstd:
+        if np.ndim(rgb.values) > 1:
+            return HSLstd(HSLstd._from_rgb_batch(np.asarray(rgb.values, dtype=np.float64)))
         R, G, B = rgb.values
         H, L, S = colorsys.rgb_to_hls(R, G, B)
         return HSLstd(np.array([H, S, L]))
 
     def to_rgb(self) -> RGB:
-        H, S, L = self.values
         from src.spaces.rgb import RGB
 
+        if np.ndim(self.values) > 1:
+            return RGB(self._to_rgb_batch(np.asarray(self.values, dtype=np.float64)))
+        H, S, L = self.values
+
         return RGB(np.array(colorsys.hls_to_rgb(H, L, S)))
+
+    # Batched (N, 3) ports of colorsys.rgb_to_hls and colorsys.hls_to_rgb.
+    @staticmethod
+    def _from_rgb_batch(rgb: np.ndarray[float]) -> np.ndarray[float]:
+        R, G, B = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+        maxc = rgb.max(axis=-1)
+        minc = rgb.min(axis=-1)
+        sumc = maxc + minc
+        rangec = maxc - minc
+        L = sumc / 2
+        achromatic = minc == maxc
+        rangec_safe = np.where(achromatic, 1, rangec)
+
+        S = np.where(
+            L <= 0.5,
+            rangec / np.where(achromatic, 1, sumc),
+            rangec / np.where(achromatic, 1, 2 - maxc - minc),
+        )
+        rc = (maxc - R) / rangec_safe
+        gc = (maxc - G) / rangec_safe
+        bc = (maxc - B) / rangec_safe
+        H = np.select([R == maxc, G == maxc], [bc - gc, 2 + rc - bc], 4 + gc - rc)
+        H = (H / 6) % 1
+
+        return np.stack([np.where(achromatic, 0, H), np.where(achromatic, 0, S), L], axis=-1)
+
+    @staticmethod
+    def _to_rgb_batch(hsl: np.ndarray[float]) -> np.ndarray[float]:
+        H, S, L = hsl[..., 0], hsl[..., 1], hsl[..., 2]
+        m2 = np.where(L <= 0.5, L * (1 + S), L + S - (L * S))
+        m1 = 2 * L - m2
+
+        def v(hue: np.ndarray[float]) -> np.ndarray[float]:
+            hue = hue % 1
+            return np.select(
+                [hue < 1 / 6, hue < 0.5, hue < 2 / 3],
+                [m1 + (m2 - m1) * hue * 6, m2, m1 + (m2 - m1) * (2 / 3 - hue) * 6],
+                m1,
+            )
+
+        rgb = np.stack([v(H + 1 / 3), v(H), v(H - 1 / 3)], axis=-1)
+        return np.where((S == 0)[..., None], L[..., None], rgb)
@@ -14,6 +14,8 @@ if TYPE_CHECKING:
 class HSV(CylindricalColorSpace):
     @staticmethod
     def from_rgb(rgb: RGB) -> HSV:
+        if np.ndim(rgb.values) > 1:
+            return HSV(HSV._from_rgb_batch(np.asarray(rgb.values, dtype=np.float64)))
         R, G, B = rgb.values
         M = max(R, G, B)
         m = min(R, G, B)
@@ -36,6 +38,10 @@ class HSV(CylindricalColorSpace):
         return HSV(np.array([H, S, V]))
 
     def to_rgb(self) -> RGB:
+        if np.ndim(self.values) > 1:
+            from .rgb import RGB
+
+            return RGB(self._to_rgb_batch(np.asarray(self.values, dtype=np.float64)))
         H, S, V = self.values
 
         i = round(H * 6)
@@ -61,15 +67,97 @@ class HSV(CylindricalColorSpace):
 
         return RGB(np.array([R, G, B]))
 
+    # Batched (N, 3) counterparts of the conversions above, following the exact same branches.
+    @staticmethod
+    def _from_rgb_batch(rgb: np.ndarray[float]) -> np.ndarray[float]:
+        R, G, B = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+        M = rgb.max(axis=-1)
+        m = rgb.min(axis=-1)
+        C = M - m
+        C_safe = np.where(C == 0, 1, C)
+
+        H = np.select(
+            [C == 0, M == R, M == G],
+            [0, ((G - B) / C_safe) + np.where(G < B, 6, 0), ((B - R) / C_safe) + 2],
+            ((R - G) / C_safe) + 4,
+        )
+        H = H / 6
+
+        V = M
+
+        S = np.where(V == 0, 0, C / np.where(V == 0, 1, V))
+
+        return np.stack([H, S, V], axis=-1)
+
+    @staticmethod
+    def _to_rgb_batch(hsv: np.ndarray[float]) -> np.ndarray[float]:
+        H, S, V = hsv[..., 0], hsv[..., 1], hsv[..., 2]
+
+        i = np.round(H * 6)
+        f = H * 6 - i
+        p = V * (1 - S)
+        q = V * (1 - f * S)
+        t = V * (1 - (1 - f) * S)
+
+        return _sextant_select(i % 6, V, p, q, t)
+
 
 class HSVstd(CylindricalColorSpace):
     @staticmethod
     def from_rgb(rgb: RGB) -> HSVstd:
+        if np.ndim(rgb.values) > 1:
+            return HSVstd(HSVstd._from_rgb_batch(np.asarray(rgb.values, dtype=np.float64)))
         R, G, B = rgb.values
         return HSVstd(np.array(colorsys.rgb_to_hsv(R, G, B)))
 
     def to_rgb(self) -> RGB:
-        H, S, B = self.values
         from src.spaces.rgb import RGB
 
+        if np.ndim(self.values) > 1:
+            return RGB(self._to_rgb_batch(np.asarray(self.values, dtype=np.float64)))
+        H, S, B = self.values
+
         return RGB(np.array(colorsys.hsv_to_rgb(H, S, B)))
+
+    # Batched (N, 3) ports of colorsys.rgb_to_hsv and colorsys.hsv_to_rgb.
+    @staticmethod
+    def _from_rgb_batch(rgb: np.ndarray[float]) -> np.ndarray[float]:
+        R, G, B = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+        maxc = rgb.max(axis=-1)
+        minc = rgb.min(axis=-1)
+        rangec = maxc - minc
+        achromatic = minc == maxc
+        rangec_safe = np.where(achromatic, 1, rangec)
+
+        S = rangec / np.where(achromatic, 1, maxc)
+        rc = (maxc - R) / rangec_safe
+        gc = (maxc - G) / rangec_safe
+        bc = (maxc - B) / rangec_safe
+        H = np.select([R == maxc, G == maxc], [bc - gc, 2 + rc - bc], 4 + gc - rc)
+        H = (H / 6) % 1
+
+        return np.stack([np.where(achromatic, 0, H), np.where(achromatic, 0, S), maxc], axis=-1)
+
+    @staticmethod
+    def _to_rgb_batch(hsv: np.ndarray[float]) -> np.ndarray[float]:
+        H, S, V = hsv[..., 0], hsv[..., 1], hsv[..., 2]
+
+        i = np.trunc(H * 6)
+        f = H * 6 - i
+        p = V * (1 - S)
+        q = V * (1 - S * f)
+        t = V * (1 - S * (1 - f))
+
+        rgb = _sextant_select(i % 6, V, p, q, t)
+        return np.where((S == 0)[..., None], V[..., None], rgb)
+
+
+def _sextant_select(
+    i: np.ndarray[float], V: np.ndarray[float], p: np.ndarray[float], q: np.ndarray[float], t: np.ndarray[float]
+) -> np.ndarray[float]:
+    # (R, G, B) of each hue sextant i in [0; 5], as in the branches of HSV.to_rgb and colorsys.hsv_to_rgb.
+    conditions = [i == 0, i == 1, i == 2, i == 3, i == 4, i == 5]
+    R = np.select(conditions, [V, q, p, p, t, V], np.nan)
+    G = np.select(conditions, [t, V, V, q, p, p], np.nan)
+    B = np.select(conditions, [p, p, t, V, V, q], np.nan)
+    return np.stack([R, G, B], axis=-1)
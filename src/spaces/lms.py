@@ -21,12 +21,12 @@ EEI_matrix = [
 class LMS(CartesianColorSpace):
     @staticmethod
     def from_xyz(xyz: XYZ) -> LMS:
-        return LMS(np.array(EEI_matrix) @ xyz.values)
+        return LMS(xyz.values @ np.transpose(EEI_matrix))
 
     def to_xyz(self) -> XYZ:
         from .xyz import XYZ
 
-        return XYZ(np.linalg.inv(np.array(EEI_matrix)) @ self.values)
+        return XYZ(self.values @ np.linalg.inv(np.array(EEI_matrix)).T)
 
     @staticmethod
     def from_rgb(
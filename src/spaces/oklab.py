@@ -23,30 +23,58 @@ Oklab_matrix = [
     [0.0259040371, 0.7827717662, -0.80806757660],
 ]
 
+Oklab_LMS_matrix_inv = np.linalg.inv(Oklab_LMS_matrix)
+Oklab_matrix_inv = np.linalg.inv(Oklab_matrix)
+
+GAMUT_EPSILON: float = 1e-6
+
 
 class OKLAB(CartesianColorSpace):
     @staticmethod
     def from_xyz(xyz: XYZ):
-        lms = Oklab_LMS_matrix @ xyz.values
+        lms = xyz.values @ np.transpose(Oklab_LMS_matrix)
         lmsp = lms ** (1 / 3)
-        lab = Oklab_matrix @ lmsp
+        lab = lmsp @ np.transpose(Oklab_matrix)
         return OKLAB(lab)
 
     def to_xyz(self):
-        lmsp = np.linalg.inv(Oklab_matrix) @ self.values
+        lmsp = self.values @ Oklab_matrix_inv.T
         lms = lmsp**3
-        xyz = np.linalg.inv(Oklab_LMS_matrix) @ lms
+        xyz = lms @ Oklab_LMS_matrix_inv.T
         from src.spaces.xyz import XYZ
 
         return XYZ(xyz)
 
+    # OkLab is defined on D65 XYZ: without the Bradford adaptation to D50, sRGB grays are on the a = b = 0 axis.
     @staticmethod
-    def from_rgb(rgb: RGB) -> OKLAB:
+    def from_rgb(rgb: RGB, bradford_adapted_d50: bool = True) -> OKLAB:
         from .xyz import XYZ
 
-        return OKLAB.from_xyz(XYZ.from_rgb(rgb))
+        return OKLAB.from_xyz(XYZ.from_rgb(rgb, bradford_adapted_d50=bradford_adapted_d50))
 
-    def to_rgb(self) -> RGB:
+    def to_rgb(self, bradford_adapted_d50: bool = True) -> RGB:
         from .xyz import XYZ
 
-        return XYZ.to_rgb(OKLAB.to_xyz(self))
+        return XYZ.to_rgb(OKLAB.to_xyz(self), bradford_adapted_d50=bradford_adapted_d50)
+
+    def in_gamut(self, bradford_adapted_d50: bool = True) -> np.ndarray[bool]:
+        rgb = self.to_rgb(bradford_adapted_d50).values
+        return np.all((rgb >= -GAMUT_EPSILON) & (rgb <= 1 + GAMUT_EPSILON), axis=-1)
+
+    def gamut_map(self, iterations: int = 16, bradford_adapted_d50: bool = True) -> OKLAB:
+        # Bringing out of sRGB gamut colors back in by scaling their chroma down (L and hue kept), bisecting the
+        # largest scale in [0; 1] still in gamut. Colors whose L alone is out of gamut end up achromatic.
+        lab = np.asarray(self.values, dtype=np.float64)
+
+        def scaled(scale: np.ndarray[float]) -> OKLAB:
+            return OKLAB(np.stack([lab[..., 0], lab[..., 1] * scale, lab[..., 2] * scale], axis=-1))
+
+        low = np.zeros(lab.shape[:-1])
+        high = np.ones(lab.shape[:-1])
+        inside = self.in_gamut(bradford_adapted_d50)
+        for _ in range(iterations):
+            middle = (low + high) / 2
+            ok = scaled(middle).in_gamut(bradford_adapted_d50)
+            low = np.where(ok, middle, low)
+            high = np.where(ok, high, middle)
+        return scaled(np.where(inside, 1.0, low))
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Iterable, Literal
 
+import numpy as np
 import pandas as pd
 
 from .abstract import CartesianColorSpace, ColorSpace
@@ -37,6 +38,9 @@ illuminant_space_names = Literal["A", "B", "C", "D50", "D55", "D65", "D75", "E",
 rgb_colorimetry = pd.read_csv("data/rgb.csv", index_col=None)
 whites_colorimetry = pd.read_csv("data/illuminant.csv", index_col=None)
 
+hex_pattern = r"#?[0-9A-Fa-f]{6}"
+hex_table = np.array(["{:02X}".format(value) for value in range(256)], dtype=object)
+
 
 class RGB(CartesianColorSpace):
     @staticmethod
@@ -113,13 +117,13 @@ class RGB(CartesianColorSpace):
         return HSVstd.from_rgb(self)
 
     @staticmethod
-    def from_oklab(oklab: OKLAB) -> RGB:
-        return OKLAB.to_rgb(oklab)
+    def from_oklab(oklab: OKLAB, bradford_adapted_d50: bool = True) -> RGB:
+        return oklab.to_rgb(bradford_adapted_d50)
 
-    def to_oklab(self) -> OKLAB:
+    def to_oklab(self, bradford_adapted_d50: bool = True) -> OKLAB:
         from .oklab import OKLAB
 
-        return OKLAB.from_rgb(self)
+        return OKLAB.from_rgb(self, bradford_adapted_d50)
 
 
 class RGB255(CartesianColorSpace):
@@ -128,7 +132,7 @@ class RGB255(CartesianColorSpace):
         return RGB255((rgb.values.clip(0, 1) * 255).round().astype(int))
 
     def to_rgb(self):
-        return RGB((self.values // 255).astype(float))
+        return RGB(np.asarray(self.values) / 255)
 
     @staticmethod
     def from_hex(hex: HEX) -> RGB255:
@@ -137,6 +141,17 @@ class RGB255(CartesianColorSpace):
     def to_hex(self):
         return HEX.from_rgb255(self)
 
+    @staticmethod
+    def from_xyz(
+        xyz: XYZ, rgb_space_name: rgb_colorimetry_space_names = "sRGB", bradford_adapted_d50: bool = True
+    ) -> RGB255:
+        return RGB255.from_rgb(xyz.to_rgb(rgb_space_name, bradford_adapted_d50))
+
+    def to_xyz(self, rgb_space_name: rgb_colorimetry_space_names = "sRGB", bradford_adapted_d50: bool = True) -> XYZ:
+        from .xyz import XYZ
+
+        return XYZ.from_rgb255(self, rgb_space_name, bradford_adapted_d50)
+
     def __str__(self):
         return f"({self.values[0]}, {self.values[1]}, {self.values[2]})"
 
@@ -157,5 +172,27 @@ class HEX(ColorSpace):
     def to_rgb255(self):
         return RGB255(tuple(map(lambda x: int(x, 16), self.values)))
 
+    @staticmethod
+    def strings_to_rgb255(strings: Iterable[str]) -> RGB255:
+        # Batched parsing of "#RRGGBB" (or "RRGGBB") strings into a (N, 3) RGB255, decoding every string in a single
+        # bytes.fromhex once they are all checked, the index of the invalid ones (e.g. row numbers) being reported.
+        strings = strings if isinstance(strings, pd.Series) else pd.Series(list(strings), dtype=object)
+        valid = strings.str.fullmatch(hex_pattern).fillna(False).astype(bool)
+        if not valid.all():
+            invalid = strings[~valid]
+            raise ValueError(
+                f"{len(invalid)} invalid hex color(s), expected #RRGGBB: "
+                + ", ".join(f"{index}: {value!r}" for index, value in invalid.head(10).items())
+                + (", ..." if len(invalid) > 10 else "")
+            )
+        digits = "".join(strings.str.lstrip("#"))
+        return RGB255(np.frombuffer(bytes.fromhex(digits), dtype=np.uint8).reshape(-1, 3).astype(int))
+
+    @staticmethod
+    def strings_from_rgb255(rgb255: RGB255) -> np.ndarray[str]:
+        # Batched formatting of a (N, 3) RGB255 into "#RRGGBB" strings through a 256-entry lookup table.
+        values = np.asarray(rgb255.values).reshape(-1, 3)
+        return "#" + hex_table[values[:, 0]] + hex_table[values[:, 1]] + hex_table[values[:, 2]]
+
     def __str__(self):
         return f"#{self.values[0]}{self.values[1]}{self.values[2]}".upper()
@@ -1,18 +1,20 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 import numpy as np
 import pandas as pd
 
 from ..chromatic_adaptation import illuminant_chromatic_adaptation_matrix
+from ..transfer import decode, decode_integer, encode
 from .abstract import CartesianColorSpace
 from .rgb import rgb_colorimetry, rgb_colorimetry_space_names, whites_colorimetry
 
 if TYPE_CHECKING:
     from .lms import LMS
     from .oklab import OKLAB
-    from .rgb import RGB
+    from .rgb import RGB, RGB255
 
 
 class XYZ(CartesianColorSpace):
@@ -20,27 +22,33 @@ class XYZ(CartesianColorSpace):
     def from_rgb(
         rgb: RGB, rgb_space_name: rgb_colorimetry_space_names = "sRGB", bradford_adapted_d50: bool = True
     ) -> XYZ:
-        M = rgb_to_xyz_matrix(rgb_space_name)
-        if bradford_adapted_d50:
-            w_ref = rgb_colorimetry[rgb_colorimetry["Name"] == rgb_space_name]["Reference White"].item()
-            if w_ref != "D50":
-                BFM = illuminant_chromatic_adaptation_matrix(w_ref, "D50", "Bradford")
-                M = BFM @ M
-        return XYZ(M @ rgb.values)
+        M = rgb_to_xyz_adapted_matrix(rgb_space_name, bradford_adapted_d50)
+        return XYZ(decode(rgb.values, rgb_space_name) @ M.T)
+
+    @staticmethod
+    def from_rgb_integer(
+        values: np.ndarray[int],
+        bit_depth: int = 8,
+        rgb_space_name: rgb_colorimetry_space_names = "sRGB",
+        bradford_adapted_d50: bool = True,
+    ) -> XYZ:
+        M = rgb_to_xyz_adapted_matrix(rgb_space_name, bradford_adapted_d50)
+        return XYZ(decode_integer(values, rgb_space_name, bit_depth) @ M.T)
+
+    @staticmethod
+    def from_rgb255(
+        rgb255: RGB255, rgb_space_name: rgb_colorimetry_space_names = "sRGB", bradford_adapted_d50: bool = True
+    ) -> XYZ:
+        return XYZ.from_rgb_integer(rgb255.values, 8, rgb_space_name, bradford_adapted_d50)
 
     def to_rgb(self, rgb_space_name: rgb_colorimetry_space_names = "sRGB", bradford_adapted_d50: bool = True) -> RGB:
-        if len(self.values) != 3:
-            raise ValueError("Argument should be a 3 floating point value numpy array.")
-
-        M = rgb_to_xyz_matrix(rgb_space_name)
-        if bradford_adapted_d50:
-            w_ref = rgb_colorimetry[rgb_colorimetry["Name"] == rgb_space_name]["Reference White"].item()
-            if w_ref != "D50":
-                BFM = illuminant_chromatic_adaptation_matrix(w_ref, "D50", "Bradford")
-                M = BFM @ M
+        if np.shape(self.values)[-1] != 3:
+            raise ValueError("Argument should be a (..., 3) floating point value numpy array.")
+
+        M_inv = xyz_to_rgb_adapted_matrix(rgb_space_name, bradford_adapted_d50)
         from .rgb import RGB
 
-        return RGB(np.linalg.inv(M) @ self.values)
+        return RGB(encode(self.values @ M_inv.T, rgb_space_name))
 
     @staticmethod
     def from_lms(lms: LMS) -> XYZ:
@@ -61,6 +69,30 @@ class XYZ(CartesianColorSpace):
         return OKLAB.from_xyz(self)
 
 
+@lru_cache
+def rgb_to_xyz_adapted_matrix(
+    rgb_space_name: rgb_colorimetry_space_names = "sRGB", bradford_adapted_d50: bool = True
+) -> np.ndarray[float]:
+    # Cached since looking the colorimetry up in the dataframes costs far more than the conversion itself.
+    M = rgb_to_xyz_matrix(rgb_space_name)
+    if bradford_adapted_d50:
+        w_ref = rgb_colorimetry[rgb_colorimetry["Name"] == rgb_space_name]["Reference White"].item()
+        if w_ref != "D50":
+            BFM = illuminant_chromatic_adaptation_matrix(w_ref, "D50", "Bradford")
+            M = BFM @ M
+    M.flags.writeable = False
+    return M
+
+
+@lru_cache
+def xyz_to_rgb_adapted_matrix(
+    rgb_space_name: rgb_colorimetry_space_names = "sRGB", bradford_adapted_d50: bool = True
+) -> np.ndarray[float]:
+    M_inv = np.linalg.inv(rgb_to_xyz_adapted_matrix(rgb_space_name, bradford_adapted_d50))
+    M_inv.flags.writeable = False
+    return M_inv
+
+
 def rgb_to_xyz_matrix(rgb_space_name: rgb_colorimetry_space_names = "sRGB") -> np.ndarray[float]:
     rgb_space = rgb_colorimetry[rgb_colorimetry["Name"] == rgb_space_name]
     xr = pd.to_numeric(rgb_space["Red Primary x"].item())
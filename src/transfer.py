@@ -0,0 +1,87 @@
+from functools import lru_cache
+from typing import Callable, Tuple
+
+import numpy as np
+
+from .spaces.rgb import rgb_colorimetry, rgb_colorimetry_space_names
+
+SRGB_GAMMA: float = 2.4
+LSTAR_EPSILON: float = 216 / 24389
+LSTAR_KAPPA: float = 24389 / 27
+
+
+# Transfer functions are sign-preserving so that out of gamut (negative) values do not turn into NaN.
+def srgb_decode(C: np.ndarray[float]) -> np.ndarray[float]:
+    A = np.abs(C)
+    return np.sign(C) * np.where(A <= 0.04045, A / 12.92, ((A + 0.055) / 1.055) ** SRGB_GAMMA)
+
+
+def srgb_encode(C: np.ndarray[float]) -> np.ndarray[float]:
+    A = np.abs(C)
+    return np.sign(C) * np.where(A <= 0.0031308, A * 12.92, 1.055 * A ** (1 / SRGB_GAMMA) - 0.055)
+
+
+def gamma_decode(C: np.ndarray[float], gamma: float) -> np.ndarray[float]:
+    return np.sign(C) * np.abs(C) ** gamma
+
+
+def gamma_encode(C: np.ndarray[float], gamma: float) -> np.ndarray[float]:
+    return np.sign(C) * np.abs(C) ** (1 / gamma)
+
+
+def lstar_decode(C: np.ndarray[float]) -> np.ndarray[float]:
+    A = np.abs(C)
+    return np.sign(C) * np.where(A > LSTAR_KAPPA * LSTAR_EPSILON / 100, ((A + 0.16) / 1.16) ** 3, A * 100 / LSTAR_KAPPA)
+
+
+def lstar_encode(C: np.ndarray[float]) -> np.ndarray[float]:
+    A = np.abs(C)
+    return np.sign(C) * np.where(A > LSTAR_EPSILON, 1.16 * np.cbrt(A) - 0.16, A * LSTAR_KAPPA / 100)
+
+
+def identity(C: np.ndarray[float]) -> np.ndarray[float]:
+    return C
+
+
+@lru_cache
+def transfer_functions(
+    rgb_space_name: rgb_colorimetry_space_names = "sRGB",
+) -> Tuple[Callable[[np.ndarray[float]], np.ndarray[float]], Callable[[np.ndarray[float]], np.ndarray[float]]]:
+    # (decode, encode) pair of a RGB space, from the "Gamma" column of data/rgb.csv. sRGB is listed as "≈2.2" but uses
+    # the piecewise curve, "L*" is the CIE lightness curve and "-" (Lab Gamut) has no companding.
+    gamma = rgb_colorimetry[rgb_colorimetry["Name"] == rgb_space_name]["Gamma"].item()
+    if rgb_space_name == "sRGB":
+        return srgb_decode, srgb_encode
+    elif gamma == "L*":
+        return lstar_decode, lstar_encode
+    elif gamma == "-":
+        return identity, identity
+    gamma = float(gamma)
+    return lambda C: gamma_decode(C, gamma), lambda C: gamma_encode(C, gamma)
+
+
+def decode(values: np.ndarray[float], rgb_space_name: rgb_colorimetry_space_names = "sRGB") -> np.ndarray[float]:
+    return transfer_functions(rgb_space_name)[0](np.asarray(values, dtype=np.float64))
+
+
+def encode(values: np.ndarray[float], rgb_space_name: rgb_colorimetry_space_names = "sRGB") -> np.ndarray[float]:
+    return transfer_functions(rgb_space_name)[1](np.asarray(values, dtype=np.float64))
+
+
+@lru_cache
+def decode_lut(rgb_space_name: rgb_colorimetry_space_names = "sRGB", bit_depth: int = 8) -> np.ndarray[float]:
+    # 2^bit_depth entries table (256 for 8 bits, 1024 for 10 bits, 65536 for 16 bits) of the decoded code values.
+    lut = decode(np.arange(2**bit_depth) / (2**bit_depth - 1), rgb_space_name)
+    lut.flags.writeable = False
+    return lut
+
+
+def decode_integer(
+    values: np.ndarray[int], rgb_space_name: rgb_colorimetry_space_names = "sRGB", bit_depth: int = 8
+) -> np.ndarray[float]:
+    # Linearizing integer code values is a table gather instead of a pow per channel. Codes out of [0; 2^bit_depth - 1]
+    # are rejected, as the gather would otherwise wrap negative ones around to the end of the table.
+    values = np.asarray(values, dtype=np.intp)
+    if values.size and (values.min() < 0 or values.max() > 2**bit_depth - 1):
+        raise ValueError(f"Integer code values should be in [0; {2**bit_depth - 1}] for a bit depth of {bit_depth}.")
+    return decode_lut(rgb_space_name, bit_depth)[values]
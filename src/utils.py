@@ -1,22 +1,92 @@
-from typing import Optional
+import sys
+from typing import Optional, Sequence, TextIO
 
-from .spaces.rgb import RGB
+import numpy as np
+
+from .spaces.rgb import HEX, RGB, RGB255
+
+decimal_table = np.array([str(value) for value in range(256)], dtype=object)
 
 
 def print_fg_bg(bg: RGB, fg: RGB, text: str, error: Optional[str] = None, padding: int = 50):
-    bg_val = bg.to_rgb255().values
-    fg_val = fg.to_rgb255().values
-    print(
-        "\033[48;2;{};{};{}m".format(*bg_val)
-        + "\033[38;2;{};{};{}m".format(*fg_val)
+    print_fg_bg_table(bg, fg, [text], [error], padding)
+
+
+def _rgb255_str(decimals: np.ndarray[str]) -> np.ndarray[str]:
+    # Same layout as str() of a (3,) int numpy array, e.g. "[255   0   7]", for every row of a (N, 3) table.
+    width = np.vectorize(len, otypes=[int])(decimals).max(axis=-1)
+    return np.array([f"[{r:>{w}} {g:>{w}} {b:>{w}}]" for (r, g, b), w in zip(decimals, width)], dtype=object)
+
+
+def format_fg_bg_table(
+    bg: RGB,
+    fg: RGB,
+    texts: Sequence[str],
+    errors: Optional[Sequence[Optional[str]]] = None,
+    padding: int = 50,
+    columns: int = 1,
+) -> list[str]:
+    # Lines of the table, one (or `columns` side by side) swatch per line, in the print_fg_bg format. bg and fg are
+    # (N, 3) or (3,) RGB broadcast to one color per text, quantized and formatted all at once.
+    errors = [None] * len(texts) if errors is None else errors
+    if len(errors) != len(texts):
+        raise ValueError(f"Got {len(errors)} errors for {len(texts)} texts.")
+    try:
+        bg_val, fg_val = np.broadcast_arrays(
+            bg.to_rgb255().values.reshape(-1, 3), fg.to_rgb255().values.reshape(-1, 3), np.empty((len(texts), 1))
+        )[:2]
+    except ValueError as e:
+        raise ValueError(
+            f"Cannot match {len(bg.values.reshape(-1, 3))} bg and {len(fg.values.reshape(-1, 3))} fg colors to "
+            f"{len(texts)} texts."
+        ) from e
+    bg_dec = decimal_table[bg_val]
+    fg_dec = decimal_table[fg_val]
+    bg_hex = HEX.strings_from_rgb255(RGB255(bg_val))
+    fg_hex = HEX.strings_from_rgb255(RGB255(fg_val))
+    bg_str = _rgb255_str(bg_dec)
+    fg_str = _rgb255_str(fg_dec)
+    escapes = (
+        "\033[48;2;" + bg_dec[:, 0] + ";" + bg_dec[:, 1] + ";" + bg_dec[:, 2] + "m"
+        "\033[38;2;" + fg_dec[:, 0] + ";" + fg_dec[:, 1] + ";" + fg_dec[:, 2] + "m"
+    )
+    error_width = max((len(error) for error in errors if error is not None), default=0) if columns > 1 else 0
+
+    cells = [
+        escape
         + text.ljust(padding)
-        + f"{bg_val}".rjust(13, " ")
+        + bg_s.rjust(13, " ")
         + "/"
-        + f"{fg_val}".ljust(13, " ")
+        + fg_s.ljust(13, " ")
         + " | "
-        + bg.to_hex().__str__()
+        + bg_h
         + "/"
-        + fg.to_hex().__str__()
+        + fg_h
         + "\033[0m"
         + (f"\033[91m{error}\033[0m" if error is not None else "")
-    )
+        + " " * (error_width - (len(error) if error is not None else 0))
+        for escape, text, bg_s, fg_s, bg_h, fg_h, error in zip(escapes, texts, bg_str, fg_str, bg_hex, fg_hex, errors)
+    ]
+    return [" ".join(cells[index : index + columns]).rstrip() for index in range(0, len(cells), columns)]
+
+
+def print_fg_bg_table(
+    bg: RGB,
+    fg: RGB,
+    texts: Sequence[str],
+    errors: Optional[Sequence[Optional[str]]] = None,
+    padding: int = 50,
+    columns: int = 1,
+    page_size: Optional[int] = None,
+    file: Optional[TextIO] = None,
+):
+    # The whole table is built in one buffer and written at once (once per page if page_size is given, waiting for
+    # enter between pages on an interactive terminal), instead of one print per row.
+    file = sys.stdout if file is None else file
+    lines = format_fg_bg_table(bg, fg, texts, errors, padding, columns)
+    page_size = page_size or max(len(lines), 1)
+    for start in range(0, len(lines), page_size):
+        if start and file.isatty():
+            input("-- more --")
+        file.write("\n".join(lines[start : start + page_size]) + "\n")
+        file.flush()